@@ -9,10 +9,10 @@ import importlib.machinery
 import importlib.util
 import os
 import sys
+import time
 import zipimport
 from functools import lru_cache
-from pathlib import Path
-from typing import List, NamedTuple, Optional, Sequence, Tuple
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from astroid.modutils import EXT_LIB_DIRS
 
@@ -86,10 +86,17 @@ class Finder:
 class ImportlibFinder(Finder):
     """A finder based on the importlib module."""
 
-    _SUFFIXES: Sequence[Tuple[str, ModuleType]] = (
-        [(s, ModuleType.C_EXTENSION) for s in importlib.machinery.EXTENSION_SUFFIXES]
-        + [(s, ModuleType.PY_SOURCE) for s in importlib.machinery.SOURCE_SUFFIXES]
-        + [(s, ModuleType.PY_COMPILED) for s in importlib.machinery.BYTECODE_SUFFIXES]
+    # Same precedence as the import system: an extension module shadows
+    # a source file of the same name. Probing costs a dictionary lookup
+    # in the directory listing, so the order has no I/O cost.
+    _SUFFIXES: Tuple[Tuple[str, ModuleType], ...] = (
+        *((s, ModuleType.C_EXTENSION) for s in importlib.machinery.EXTENSION_SUFFIXES),
+        *((s, ModuleType.PY_SOURCE) for s in importlib.machinery.SOURCE_SUFFIXES),
+        *((s, ModuleType.PY_COMPILED) for s in importlib.machinery.BYTECODE_SUFFIXES),
+    )
+    _INIT_NAMES: Tuple[str, ...] = (
+        "__init__.py",
+        "__init__" + importlib.machinery.BYTECODE_SUFFIXES[0],
     )
 
     def find_module(
@@ -105,37 +112,36 @@ class ImportlibFinder(Finder):
             try:
                 spec = importlib.util.find_spec(modname)
                 if spec:
-                    if spec.loader is importlib.machinery.BuiltinImporter:
-                        return ModuleSpec(
-                            name=modname,
-                            location=None,
-                            type=ModuleType.C_BUILTIN,
-                        )
-                    if spec.loader is importlib.machinery.FrozenImporter:
-                        return ModuleSpec(
-                            name=modname,
-                            location=getattr(spec.loader_state, "filename", None),
-                            type=ModuleType.PY_FROZEN,
-                        )
+                    builtin_spec = _builtin_or_frozen_spec(modname, spec)
+                    if builtin_spec is not None:
+                        return builtin_spec
             except ValueError:
                 pass
             submodule_path = sys.path
 
+        # Paths are only joined on a hit, the file names probed
+        # in each directory are the same for every entry.
+        module_files = [(modname + suffix, type_) for suffix, type_ in self._SUFFIXES]
         for entry in submodule_path:
-            package_directory = os.path.join(entry, modname)
-            for suffix in (".py", importlib.machinery.BYTECODE_SUFFIXES[0]):
-                package_file_name = "__init__" + suffix
-                file_path = os.path.join(package_directory, package_file_name)
-                if os.path.isfile(file_path):
-                    return ModuleSpec(
-                        name=modname,
-                        location=package_directory,
-                        type=ModuleType.PKG_DIRECTORY,
-                    )
-            for suffix, type_ in ImportlibFinder._SUFFIXES:
-                file_name = modname + suffix
-                file_path = os.path.join(entry, file_name)
-                if os.path.isfile(file_path):
+            dir_entries = _dir_entries(entry)
+            if not dir_entries:
+                continue
+            package = dir_entries.get(modname)
+            if package is not None and package.is_dir():
+                package_directory = os.path.join(entry, modname)
+                package_entries = _dir_entries(package_directory)
+                for init_name in self._INIT_NAMES:
+                    package_file = package_entries.get(init_name)
+                    if package_file is not None and package_file.is_file():
+                        return ModuleSpec(
+                            name=modname,
+                            location=package_directory,
+                            type=ModuleType.PKG_DIRECTORY,
+                        )
+            for file_name, type_ in module_files:
+                module_file = dir_entries.get(file_name)
+                if module_file is not None and module_file.is_file():
+                    file_path = os.path.join(entry, file_name)
                     return ModuleSpec(name=modname, location=file_path, type=type_)
         return None
 
@@ -150,7 +156,7 @@ class ImportlibFinder(Finder):
             path = [
                 os.path.join(p, *processed)
                 for p in sys.path
-                if os.path.isdir(os.path.join(p, *processed))
+                if _subdir_exists(p, processed)
             ]
         elif spec.name == "distutils" and not any(
             spec.location.lower().startswith(ext_lib_dir.lower())
@@ -164,10 +170,8 @@ class ImportlibFinder(Finder):
             # and can be triggered manually from GitHub Actions
             distutils_spec = importlib.util.find_spec("distutils")
             if distutils_spec and distutils_spec.origin:
-                origin_path = Path(
-                    distutils_spec.origin
-                )  # e.g. .../distutils/__init__.py
-                path = [str(origin_path.parent)]  # e.g. .../distutils
+                # e.g. .../distutils/__init__.py -> .../distutils
+                path = [os.path.dirname(distutils_spec.origin)]
             else:
                 path = [spec.location]
         else:
@@ -180,17 +184,18 @@ class ExplicitNamespacePackageFinder(ImportlibFinder):
 
     def find_module(self, modname, module_parts, processed, submodule_path):
         if processed:
-            modname = ".".join(processed + [modname])
-        if util.is_namespace(modname) and modname in sys.modules:
-            submodule_path = sys.modules[modname].__path__
-            return ModuleSpec(
-                name=modname,
-                location="",
-                origin="namespace",
-                type=ModuleType.PY_NAMESPACE,
-                submodule_search_locations=submodule_path,
-            )
-        return None
+            modname = ".".join((*processed, modname))
+        # Check sys.modules first, most modules are not imported namespaces.
+        module = sys.modules.get(modname)
+        if module is None or not util.is_namespace(modname):
+            return None
+        return ModuleSpec(
+            name=modname,
+            location="",
+            origin="namespace",
+            type=ModuleType.PY_NAMESPACE,
+            submodule_search_locations=module.__path__,
+        )
 
     def contribute_to_path(self, spec, processed):
         return spec.submodule_search_locations
@@ -199,13 +204,9 @@ class ExplicitNamespacePackageFinder(ImportlibFinder):
 class ZipFinder(Finder):
     """Finder that knows how to find a module inside zip files."""
 
-    def __init__(self, path):
-        super().__init__(path)
-        self._zipimporters = _precache_zipimporters(path)
-
     def find_module(self, modname, module_parts, processed, submodule_path):
         try:
-            file_type, filename, path = _search_zip(module_parts, self._zipimporters)
+            file_type, filename, path = _search_zip(module_parts, self._path)
         except ImportError:
             return None
 
@@ -253,12 +254,94 @@ _SPEC_FINDERS = (
 )
 
 
-def _is_setuptools_namespace(location):
+def _builtin_or_frozen_spec(modname, spec) -> Optional[ModuleSpec]:
+    """Convert an importlib spec of a builtin or frozen module.
+
+    Return None for any other kind of module.
+    """
+    if spec.loader is importlib.machinery.BuiltinImporter:
+        return ModuleSpec(
+            name=modname,
+            location=None,
+            type=ModuleType.C_BUILTIN,
+        )
+    if spec.loader is importlib.machinery.FrozenImporter:
+        return ModuleSpec(
+            name=modname,
+            location=getattr(spec.loader_state, "filename", None),
+            type=ModuleType.PY_FROZEN,
+        )
+    return None
+
+
+# Coarsest timestamp resolution of common filesystems (FAT uses 2 seconds).
+_MTIME_GRANULARITY = 2
+
+
+def _list_dir_entries(path: str) -> Dict[str, os.DirEntry]:
     try:
+        with os.scandir(path) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+
+@lru_cache(maxsize=1024)
+def _cached_dir_entries(
+    path: str, st_dev: int, st_ino: int, mtime_ns: int
+) -> Dict[str, os.DirEntry]:
+    return _list_dir_entries(path)
+
+
+def _dir_entries(path: str) -> Dict[str, os.DirEntry]:
+    """Return the entries of the given directory, indexed by name.
+
+    A single directory listing replaces the many stat calls needed
+    to probe every candidate file name. It is cached until the
+    modification time of the directory changes.
+
+    A directory modified within the timestamp resolution of its
+    filesystem could change again without its modification time moving,
+    so its listing is not cached. Changes which do not update the
+    modification time at all are only seen after ``clear_caches()``.
+    """
+    path = path or os.curdir
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {}
+    if time.time() - stat.st_mtime < _MTIME_GRANULARITY:
+        return _list_dir_entries(path)
+    # Relative paths depend on the current directory, the device and
+    # inode numbers tell apart directories reached through the same path.
+    return _cached_dir_entries(path, stat.st_dev, stat.st_ino, stat.st_mtime_ns)
+
+
+def _subdir_exists(parent: str, child_parts: Sequence[str]) -> bool:
+    """Check whether the given parts of a package are a directory under parent.
+
+    The last part is looked up in the cached listing of its parent directory.
+    """
+    *parent_parts, name = child_parts
+    entry = _dir_entries(os.path.join(parent, *parent_parts)).get(name)
+    return entry is not None and entry.is_dir()
+
+
+def _is_setuptools_namespace(location: str) -> bool:
+    # Relative locations depend on the current directory,
+    # only absolute ones are safe to cache.
+    return _cached_is_setuptools_namespace(os.path.abspath(location))
+
+
+@lru_cache(maxsize=4096)
+def _cached_is_setuptools_namespace(location: str) -> bool:
+    try:
+        # A single open() call also rejects locations which are module
+        # files (ENOTDIR) or packages without __init__.py (ENOENT).
         with open(os.path.join(location, "__init__.py"), "rb") as stream:
             data = stream.read(4096)
     except OSError:
-        return None
+        return False
     else:
         extend_path = b"pkgutil" in data and b"extend_path" in data
         declare_namespace = (
@@ -279,11 +362,9 @@ def _precache_zipimporters(path=None):
     For each path that has not been already cached
     in the sys.path_importer_cache, create a new zipimporter
     instance and add it into the cache.
-    Return a dict associating all paths, stored in the cache, to corresponding
-    zipimporter instances.
 
     :param path: paths that has to be added into the cache
-    :return: association between paths stored in the cache and zipimporter instances
+    :return: whether a new zipimporter instance was added into the cache
     """
     pic = sys.path_importer_cache
 
@@ -295,22 +376,22 @@ def _precache_zipimporters(path=None):
     req_paths = tuple(path or sys.path)
     cached_paths = tuple(pic)
     new_paths = _cached_set_diff(req_paths, cached_paths)
+    added = False
     # pylint: disable=no-member
     for entry_path in new_paths:
         try:
             pic[entry_path] = zipimport.zipimporter(entry_path)
         except zipimport.ZipImportError:
             continue
-    return {
-        key: value
-        for key, value in pic.items()
-        if isinstance(value, zipimport.zipimporter)
-    }
+        added = True
+    return added
 
 
-def _search_zip(modpath, pic):
-    for filepath, importer in list(pic.items()):
-        if importer is not None:
+def _search_zipimporters(modpath):
+    # pylint: disable=no-member
+    for filepath, importer in sys.path_importer_cache.items():
+        # pylint: disable-next=unidiomatic-typecheck
+        if type(importer) is zipimport.zipimporter:
             found = importer.find_module(modpath[0])
             if found:
                 if not importer.find_module(os.path.sep.join(modpath)):
@@ -327,9 +408,20 @@ def _search_zip(modpath, pic):
     raise ImportError(f"No module named {'.'.join(modpath)}")
 
 
+def _search_zip(modpath, path=None):
+    try:
+        return _search_zipimporters(modpath)
+    except ImportError:
+        # Only look for zip files among the paths which are not
+        # in the importer cache yet when the known ones don't match.
+        if not _precache_zipimporters(path):
+            raise
+        return _search_zipimporters(modpath)
+
+
 def _find_spec_with_path(search_path, modname, module_parts, processed, submodule_path):
-    finders = [finder(search_path) for finder in _SPEC_FINDERS]
-    for finder in finders:
+    for finder_cls in _SPEC_FINDERS:
+        finder = finder_cls(search_path)
         spec = finder.find_module(modname, module_parts, processed, submodule_path)
         if spec is None:
             continue
@@ -355,10 +447,36 @@ def find_spec(modpath, path=None):
     :return: A module spec, which describes how the module was
              found and where.
     """
+    if path is None and len(modpath) == 1:
+        # Builtin and frozen modules are found before anything on sys.path,
+        # so the spec of an imported one is the spec we would find.
+        imported_spec = getattr(sys.modules.get(modpath[0]), "__spec__", None)
+        if imported_spec is not None:
+            spec = _builtin_or_frozen_spec(modpath[0], imported_spec)
+            if spec is not None:
+                return spec
+    return _find_spec(
+        tuple(modpath),
+        tuple(path) if path is not None else None,
+        tuple(sys.path),
+        os.getcwd(),
+    )
+
+
+@lru_cache(maxsize=1024)
+def _find_spec(
+    module_path: Tuple[str, ...],
+    path: Optional[Tuple[str, ...]],
+    _sys_path: Tuple[str, ...],
+    _cwd: str,
+) -> ModuleSpec:
+    # ``_sys_path`` and ``_cwd`` are only part of the cache key: the finders
+    # fall back to sys.path, and relative entries such as "" depend on the
+    # current directory, so a cached spec is stale once either changes.
     _path = path or sys.path
 
     # Need a copy for not mutating the argument.
-    modpath = modpath[:]
+    modpath = list(module_path)
 
     submodule_path = None
     module_parts = modpath[:]
@@ -377,3 +495,19 @@ def find_spec(modpath, path=None):
             spec = spec._replace(submodule_search_locations=submodule_path)
 
     return spec
+
+
+def clear_caches() -> None:
+    """Clear the caches used to find module specs.
+
+    Results are cached assuming the filesystem does not change while
+    modules are looked up; long-running processes should call this
+    when that does not hold anymore.
+    """
+    for lru in (
+        _find_spec,
+        _cached_is_setuptools_namespace,
+        _cached_dir_entries,
+        _cached_set_diff,
+    ):
+        lru.cache_clear()
@@ -383,6 +383,7 @@ class AstroidManager:
             ObjectModel.attributes,
         ):
             lru_cache.cache_clear()
+        spec.clear_caches()
 
         self.bootstrap()
 
@@ -324,6 +324,9 @@ class ClearCacheTest(unittest.TestCase, resources.AstroidCacheSetupMixin):
             astroid.nodes.node_classes.LookupMixIn.lookup,
             astroid.modutils._cache_normalize_path_,
             astroid.interpreter.objectmodel.ObjectModel.attributes,
+            astroid.interpreter._import.spec._find_spec,
+            astroid.interpreter._import.spec._cached_is_setuptools_namespace,
+            astroid.interpreter._import.spec._cached_dir_entries,
         )
 
         # Get a baseline for the size of the cache after simply calling bootstrap()
@@ -333,6 +336,7 @@ class ClearCacheTest(unittest.TestCase, resources.AstroidCacheSetupMixin):
         ClassDef().lookup("garbage")
         is_standard_module("unittest", std_path=["garbage_path"])
         astroid.interpreter.objectmodel.ObjectModel().attributes()
+        astroid.interpreter._import.spec._is_setuptools_namespace("garbage_path")
 
         # Did the hits or misses actually happen?
         incremented_cache_infos = [lru.cache_info() for lru in lrus]
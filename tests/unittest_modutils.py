@@ -6,11 +6,13 @@
 unit tests for module modutils (module manipulation utilities)
 """
 import email
+import importlib.machinery
 import os
 import shutil
 import sys
 import tempfile
 import unittest
+import unittest.mock
 import xml
 from pathlib import Path
 from xml import etree
@@ -45,6 +47,41 @@ class ModuleFileTest(unittest.TestCase):
             ["data", "MyPyPa-0.1.0-py2.5.zip", self.package],
         )
 
+    def test_find_module_after_sys_path_change(self) -> None:
+        found_spec = spec.find_spec(["json"])
+        self.assertEqual(found_spec.type, spec.ModuleType.PKG_DIRECTORY)
+
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        module_path = os.path.join(tmp_dir, "json.py")
+        with open(module_path, "w", encoding="utf-8"):
+            pass
+        self.addCleanup(sys.path.remove, tmp_dir)
+        sys.path.insert(0, tmp_dir)
+        found_spec = spec.find_spec(["json"])
+        self.assertEqual(found_spec.type, spec.ModuleType.PY_SOURCE)
+        self.assertEqual(found_spec.location, module_path)
+
+    def test_find_module_in_relative_path_after_chdir(self) -> None:
+        module_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, module_dir)
+        other_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, other_dir)
+        with open(os.path.join(module_dir, "mymodule.py"), "w", encoding="utf-8"):
+            pass
+        self.addCleanup(os.chdir, os.getcwd())
+
+        os.chdir(module_dir)
+        found_spec = spec.find_spec(["mymodule"], ["."])
+        self.assertEqual(found_spec.type, spec.ModuleType.PY_SOURCE)
+        os.chdir(other_dir)
+        with self.assertRaises(ImportError):
+            spec.find_spec(["mymodule"], ["."])
+
+    def test_find_module_in_empty_path(self) -> None:
+        with self.assertRaises(ImportError):
+            spec.find_spec(["json"], [])
+
     def test_find_egg_module(self) -> None:
         found_spec = spec.find_spec(
             [self.package], [resources.find("data/MyPyPa-0.1.0-py2.5.egg")]
@@ -55,6 +92,87 @@ class ModuleFileTest(unittest.TestCase):
             ["data", "MyPyPa-0.1.0-py2.5.egg", self.package],
         )
 
+    def test_find_imported_builtin_module(self) -> None:
+        with unittest.mock.patch.object(
+            spec, "_find_spec", wraps=spec._find_spec
+        ) as find_spec_mock:
+            found_spec = spec.find_spec(["sys"])
+        find_spec_mock.assert_not_called()
+        self.assertEqual(found_spec.type, spec.ModuleType.C_BUILTIN)
+        self.assertIsNone(found_spec.location)
+
+    def test_find_imported_source_module(self) -> None:
+        """Imported modules which are not builtin can be shadowed on sys.path,
+        they are still looked up by the finders."""
+        with unittest.mock.patch.object(
+            spec, "_find_spec", wraps=spec._find_spec
+        ) as find_spec_mock:
+            found_spec = spec.find_spec(["unittest"])
+        find_spec_mock.assert_called_once()
+        self.assertEqual(found_spec.type, spec.ModuleType.PKG_DIRECTORY)
+
+    def test_find_module_added_after_directory_listing(self) -> None:
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        # An old modification time gets the directory listing cached
+        os.utime(tmp_dir, (0, 0))
+        with self.assertRaises(ImportError):
+            spec.find_spec(["mymodule"], [tmp_dir])
+
+        module_path = os.path.join(tmp_dir, "mymodule.py")
+        with open(module_path, "w", encoding="utf-8"):
+            pass
+        found_spec = spec.find_spec(["mymodule"], [tmp_dir])
+        self.assertEqual(found_spec.type, spec.ModuleType.PY_SOURCE)
+        self.assertEqual(found_spec.location, module_path)
+
+    def test_find_module_added_without_directory_mtime_change(self) -> None:
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        # Treat the directory as recently modified however slow the test runs
+        patcher = unittest.mock.patch.object(spec, "_MTIME_GRANULARITY", float("inf"))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        with self.assertRaises(ImportError):
+            spec.find_spec(["mymodule"], [tmp_dir])
+
+        # Simulate a file created within the same timestamp tick
+        dir_stat = os.stat(tmp_dir)
+        with open(os.path.join(tmp_dir, "mymodule.py"), "w", encoding="utf-8"):
+            pass
+        os.utime(tmp_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+        found_spec = spec.find_spec(["mymodule"], [tmp_dir])
+        self.assertEqual(found_spec.type, spec.ModuleType.PY_SOURCE)
+
+    def test_cached_listing_needs_clear_caches_without_mtime_change(self) -> None:
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        os.utime(tmp_dir, (0, 0))
+        with self.assertRaises(ImportError):
+            spec.find_spec(["mymodule"], [tmp_dir])
+
+        with open(os.path.join(tmp_dir, "mymodule.py"), "w", encoding="utf-8"):
+            pass
+        os.utime(tmp_dir, (0, 0))
+        with self.assertRaises(ImportError):
+            spec.find_spec(["mymodule"], [tmp_dir])
+        spec.clear_caches()
+        found_spec = spec.find_spec(["mymodule"], [tmp_dir])
+        self.assertEqual(found_spec.type, spec.ModuleType.PY_SOURCE)
+
+    def test_extension_module_shadows_source_module(self) -> None:
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        extension_suffix = importlib.machinery.EXTENSION_SUFFIXES[0]
+        for file_name in ("mymodule.py", "mymodule" + extension_suffix):
+            with open(os.path.join(tmp_dir, file_name), "w", encoding="utf-8"):
+                pass
+        found_spec = spec.find_spec(["mymodule"], [tmp_dir])
+        self.assertEqual(found_spec.type, spec.ModuleType.C_EXTENSION)
+        self.assertEqual(
+            found_spec.location, os.path.join(tmp_dir, "mymodule" + extension_suffix)
+        )
+
 
 class LoadModuleFromNameTest(unittest.TestCase):
     """load a python module from it's name"""